@@ -7,11 +7,12 @@ multiple repositories by detecting the repo root and loading configuration.
 Design:
 - Read a mapping of ENV_VAR -> 1Password reference from parquet file via MCP server.
   Each reference is an op:// URL: op://<vault>/<item>/<field>
-- Use the `op` CLI to resolve each secret.
+- Use the `op` CLI to resolve the secrets (one `op inject` call, `op read` per key as fallback).
 - Update (or append) the corresponding ENV_VAR entries in the target .env file.
 
 Features:
 - Automatic backup: Creates timestamped backup in .env.backups/ before modification
+- Incremental sync: Variables unchanged since the last sync are not refetched (--force to refetch)
 - Session check: Verifies 1Password CLI session before proceeding
 - Security: NEVER prints secret values, only variable names
 - MCP Integration: Uses parquet MCP server for data access (per MCP access policy)
@@ -48,36 +49,96 @@ Inclusion List (Whitelist):
 Usage:
     python foundation/scripts/op_sync_env_from_1password.py           # uses .env in repo root
     python foundation/scripts/op_sync_env_from_1password.py path/to/.env.custom
+    python foundation/scripts/op_sync_env_from_1password.py --force   # refetch every secret
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import importlib.util
+import json
 import os
+import re
+import secrets
+import shutil
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AsyncExitStack
 from datetime import datetime
+from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import AbstractSet, Any, Iterable, Iterator
 
-import pandas as pd
-
-# Try to import YAML parser
+# Try to import YAML parser (prefer the libyaml C loader when available)
 try:
     import yaml
+
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader  # type: ignore
 except ImportError:
     yaml = None  # type: ignore
 
-# Try to import MCP client dependencies
+# Prefer orjson (C serializer, writes bytes directly) for JSON credentials files
 try:
-    import asyncio
-    import json
+    import orjson
 
-    from mcp import ClientSession, StdioServerParameters
-    from mcp.client.stdio import stdio_client
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 
-    MCP_AVAILABLE = True
+    _json_loads = orjson.loads
 except ImportError:
-    MCP_AVAILABLE = False
+    orjson = None  # type: ignore
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
+
+# Check for MCP client dependencies without importing them; asyncio and mcp
+# are only imported once mappings are actually loaded via the MCP server
+MCP_AVAILABLE = importlib.util.find_spec("mcp") is not None
+
+# Concurrent `op read` calls when the `op inject` batch fails
+# (override with the OP_SYNC_PARALLELISM environment variable)
+OP_READ_MAX_WORKERS = 10
+
+# Gitignored directory (relative to repo root) for JSON credentials files
+CREDS_DIRNAME = ".creds"
+
+# .creds filenames for JSON credentials with a conventional name
+CREDS_FILENAMES: dict[str, str] = {
+    "GOOGLE_OAUTH_CREDENTIALS": "gcp-oauth.keys.json",
+    "GOOGLE_APPLICATION_CREDENTIALS": "gcp-service-account.json",
+}
+
+# Section headers written by sync_env, dropped from preserved comments on re-sync
+_SKIP_COMMENT_RE = re.compile(
+    r"^\s*# Variables (managed by 1Password sync|not managed by 1Password)"
+)
+
+# op_reference values that still need to be configured
+_PLACEHOLDER_RE = re.compile(r"^PLACEHOLDER_")
+
+# Values that can be written to .env unquoted
+_ENV_SAFE = re.compile(r"^[A-Za-z0-9_./:@=+\-]*$")
+
+# Characters that can't appear inside a single-quoted .env value
+_ENV_NO_SINGLE_QUOTE = re.compile(r"['\r\n]")
+
+# Escape sequences written by quote_env_value inside double quotes
+_ENV_ESCAPE_RE = re.compile(r'\\([\\"nr])')
+_ENV_UNESCAPES = {"\\": "\\", '"': '"', "n": "\n", "r": "\r"}
+
+# One .env line: a KEY=value assignment, or anything else (comment, blank, other)
+_ENV_LINE_RE = re.compile(
+    r"^(?:[ \t]*(?P<key>[^#\s=][^=\r\n]*?)[ \t]*=(?P<value>[^\r\n]*)|(?P<other>[^\r\n]*))\r?$",
+    re.MULTILINE,
+)
 
 
 def find_repo_root(start_path: Path | None = None) -> Path:
@@ -97,16 +158,29 @@ def find_repo_root(start_path: Path | None = None) -> Path:
         # Start from script location (foundation/scripts/)
         start_path = Path(__file__).parent.parent.parent
 
-    current = start_path.resolve()
+    return _find_repo_root(str(start_path.resolve()))
+
+
+@functools.lru_cache(maxsize=4)
+def _find_repo_root(start_str: str) -> Path:
+    """Walk up from a resolved start path. See find_repo_root."""
+    current = Path(start_str)
 
     # Walk up directory tree looking for indicators
     for _ in range(10):  # Limit search depth
+        # One directory listing answers both checks (instead of two stats)
+        try:
+            with os.scandir(current) as it:
+                entries = {entry.name for entry in it}
+        except OSError:
+            entries = set()
+
         # Check for foundation-config.yaml (primary indicator)
-        if (current / "foundation-config.yaml").exists():
+        if "foundation-config.yaml" in entries:
             return current
 
         # Check for .git directory (secondary indicator)
-        if (current / ".git").exists():
+        if ".git" in entries:
             return current
 
         # Move up one level
@@ -140,8 +214,8 @@ def load_config(repo_root: Path) -> dict[str, Any]:
     committed_config = repo_root / "foundation-config.yaml"
     if committed_config.exists():
         try:
-            with open(committed_config, encoding="utf-8") as f:
-                committed_data = yaml.safe_load(f) or {}
+            with open(committed_config, "rb") as f:
+                committed_data = yaml.load(f, Loader=_YamlLoader) or {}
                 config = committed_data
         except Exception as e:
             print(f"WARNING: Failed to load {committed_config}: {e}")
@@ -150,8 +224,8 @@ def load_config(repo_root: Path) -> dict[str, Any]:
     local_config = repo_root / "foundation-config.local.yaml"
     if local_config.exists():
         try:
-            with open(local_config, encoding="utf-8") as f:
-                local_data = yaml.safe_load(f) or {}
+            with open(local_config, "rb") as f:
+                local_data = yaml.load(f, Loader=_YamlLoader) or {}
                 # Deep merge local config into committed config
                 # For now, just override at top level
                 config.update(local_data)
@@ -161,6 +235,16 @@ def load_config(repo_root: Path) -> dict[str, Any]:
     return config
 
 
+def _op_sync_cfg(config: dict[str, Any] | None) -> dict[str, Any]:
+    """Get the tooling.env_management.onepassword_sync section (empty dict if missing)."""
+    return (
+        (((config or {}).get("tooling") or {}).get("env_management") or {}).get(
+            "onepassword_sync"
+        )
+        or {}
+    )
+
+
 def get_exclusions(config: dict[str, Any]) -> set[str]:
     """
     Get exclusion list from configuration.
@@ -171,38 +255,19 @@ def get_exclusions(config: dict[str, Any]) -> set[str]:
     Returns:
         Set of variable names to exclude
     """
+    onepassword_sync = _op_sync_cfg(config)
     exclusions: set[str] = set()
 
-    # Get default exclusions from committed config
-    try:
-        default_exclusions = (
-            config.get("tooling", {})
-            .get("env_management", {})
-            .get("onepassword_sync", {})
-            .get("default_exclusions", [])
-        )
-        if default_exclusions:
-            exclusions.update(default_exclusions)
-    except (AttributeError, TypeError):
-        pass
+    # Default exclusions from committed config
+    exclusions.update(onepassword_sync.get("default_exclusions") or [])
 
-    # Get instance-specific exclusions from local config
-    try:
-        local_exclusions = (
-            config.get("tooling", {})
-            .get("env_management", {})
-            .get("onepassword_sync", {})
-            .get("exclusions", [])
-        )
-        if local_exclusions:
-            exclusions.update(local_exclusions)
-    except (AttributeError, TypeError):
-        pass
+    # Instance-specific exclusions from local config
+    exclusions.update(onepassword_sync.get("exclusions") or [])
 
     return exclusions
 
 
-def get_inclusions(config: dict[str, Any]) -> set[str] | None:
+def get_inclusions(config: dict[str, Any]) -> frozenset[str] | None:
     """
     Get inclusion list (whitelist) from configuration.
 
@@ -213,58 +278,165 @@ def get_inclusions(config: dict[str, Any]) -> set[str] | None:
         config: Configuration dictionary
 
     Returns:
-        Set of variable names to include, or None if no inclusion list is specified
+        Frozen set of variable names to include, or None if no inclusion list is specified
     """
+    onepassword_sync = _op_sync_cfg(config)
     inclusions: set[str] = set()
 
-    # Get inclusions from committed config
-    try:
-        onepassword_sync = (
-            config.get("tooling", {})
-            .get("env_management", {})
-            .get("onepassword_sync", {})
-        )
+    # Support flat list format: inclusions: [VAR1, VAR2, ...]
+    inclusions.update(onepassword_sync.get("inclusions") or [])
 
-        # Support flat list format: inclusions: [VAR1, VAR2, ...]
-        flat_inclusions = onepassword_sync.get("inclusions", [])
-        if flat_inclusions:
-            inclusions.update(flat_inclusions)
-
-        # Support nested format from expected_variables:
-        # expected_variables:
-        #   required: [VAR1, VAR2]
-        #   recommended: [VAR3]
-        #   optional: [VAR4]
-        expected_vars = onepassword_sync.get("expected_variables", {})
-        if expected_vars:
-            # Flatten all categories into a single list
-            for category in ["required", "recommended", "optional", "production"]:
-                category_vars = expected_vars.get(category, [])
-                if category_vars:
-                    inclusions.update(category_vars)
-    except (AttributeError, TypeError):
-        pass
-
-    # Get instance-specific inclusions from local config
-    try:
-        local_inclusions = (
-            config.get("tooling", {})
-            .get("env_management", {})
-            .get("onepassword_sync", {})
-            .get("inclusions", [])
-        )
-        if local_inclusions:
-            inclusions.update(local_inclusions)
-    except (AttributeError, TypeError):
-        pass
+    # Support nested format from expected_variables:
+    # expected_variables:
+    #   required: [VAR1, VAR2]
+    #   recommended: [VAR3]
+    #   optional: [VAR4]
+    expected_vars = onepassword_sync.get("expected_variables") or {}
+    # Flatten all categories into a single list
+    for category in ["required", "recommended", "optional", "production"]:
+        inclusions.update(expected_vars.get(category) or [])
 
     # Return None if no inclusions specified (means sync all)
-    # Return set if inclusions specified (means whitelist mode)
-    return inclusions if inclusions else None
+    # Return frozenset if inclusions specified (means whitelist mode)
+    return frozenset(inclusions) if inclusions else None
+
+
+def mcp_server_env(repo_root: Path) -> dict[str, str]:
+    """
+    Build the environment for the parquet MCP server subprocess.
+
+    Loads the .env file from repo root to get DATA_DIR and other env vars.
+    Priority: 1) .env file, 2) environment variable, 3) default to repo_root/data
+
+    Args:
+        repo_root: Path to repository root
+
+    Returns:
+        Environment dictionary for the server process
+    """
+    env = os.environ.copy()
+    # Simple env file parsing (don't use dotenv to avoid dependency)
+    _, file_vars = parse_env_file(repo_root / ".env")
+    for key, value in file_vars.items():
+        # Override existing env vars with .env file values
+        # This allows .env to override environment variables
+        env[key] = unquote_env_value(value)
+
+    # Auto-set DATA_DIR if not already set (defaults to repo_root/data)
+    # This ensures MCP server can find the data directory
+    # If DATA_DIR is set in .env or environment, it will be used (matches Cursor MCP config)
+    if "DATA_DIR" not in env:
+        data_dir = repo_root / "data"
+        env["DATA_DIR"] = str(data_dir.resolve())
+
+    return env
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_parquet_server_cached(
+    repo_root_str: str,
+    env_path: str | None,
+    env_python: str | None,
+    cursor_mtime_ns: int,
+) -> tuple[str, str]:
+    """
+    Auto-detect parquet MCP server location.
+
+    Args:
+        repo_root_str: Repository root
+        env_path: Value of PARQUET_MCP_SERVER_PATH (part of the cache key)
+        env_python: Value of PARQUET_MCP_PYTHON (part of the cache key)
+        cursor_mtime_ns: mtime of ~/.cursor/mcp.json, 0 if missing (part of the cache key)
+
+    Returns:
+        Tuple of (server_path, command) where:
+        - server_path: Path to the server script
+        - command: Command to run (python3, bash, or from config)
+    """
+    # Try environment variable first
+    if env_path and Path(env_path).exists():
+        # Determine command based on file extension
+        if env_path.endswith(".sh"):
+            return (env_path, "bash")
+        else:
+            return (env_path, _get_python_command(repo_root_str, env_python))
+
+    # Check Cursor config location: ~/.cursor/mcp.json
+    cursor_config_path = Path.home() / ".cursor" / "mcp.json"
+    if cursor_config_path.exists():
+        try:
+            with open(cursor_config_path, encoding="utf-8") as f:
+                cursor_config = json.load(f)
+                mcp_servers = cursor_config.get("mcpServers", {})
+                # Look for parquet server in Cursor config
+                for server_name, server_config in mcp_servers.items():
+                    # Check if server name contains "parquet" (case-insensitive)
+                    if "parquet" in server_name.lower():
+                        # Get command path from config
+                        command = server_config.get("command")
+                        if command and Path(command).exists():
+                            # Determine command based on file extension
+                            if command.endswith(".sh"):
+                                return (command, "bash")
+                            elif command.endswith(".py"):
+                                return (command, _get_python_command(repo_root_str, env_python))
+                            else:
+                                # Try to extract command from args if present
+                                args = server_config.get("args", [])
+                                if args and len(args) > 0:
+                                    # If args[0] is a Python script, use python command
+                                    if args[0].endswith(".py"):
+                                        return (args[0], _get_python_command(repo_root_str, env_python))
+                                # Default to using the command as-is
+                                return (command, command)
+        except (json.JSONDecodeError, KeyError, Exception) as e:
+            # Silently continue if config parsing fails
+            pass
+
+    # Check repo location: mcp/parquet/parquet_mcp_server.py
+    server_path = Path(repo_root_str) / "mcp" / "parquet" / "parquet_mcp_server.py"
+    if server_path.exists():
+        return (str(server_path), _get_python_command(repo_root_str, env_python))
+
+    raise RuntimeError(
+        "Could not find parquet MCP server. "
+        f"Checked: environment variable, ~/.cursor/mcp.json, and {server_path}\n"
+        "Set PARQUET_MCP_SERVER_PATH environment variable, configure in ~/.cursor/mcp.json, "
+        "or ensure the server is at mcp/parquet/parquet_mcp_server.py"
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_python_command(repo_root_str: str, env_python: str | None) -> str:
+    """
+    Get the Python command to use for running the parquet server.
+
+    env_python is the value of PARQUET_MCP_PYTHON, passed in so it is part of
+    the cache key.
+    """
+    # Try to find venv Python relative to repo root
+    repo_root = Path(repo_root_str)
+    possible_venv_paths = [
+        repo_root / "venv" / "bin" / "python3",
+        repo_root / "execution" / "venv" / "bin" / "python3",
+        repo_root / ".venv" / "bin" / "python3",
+    ]
+
+    for venv_python in possible_venv_paths:
+        if venv_python.exists():
+            return str(venv_python)
+
+    # Fall back to system python3
+    return env_python or "python3"
 
 
 class ParquetMCPClient:
-    """Minimal MCP client for reading env_var_mappings parquet file."""
+    """
+    Minimal MCP client for reading env_var_mappings parquet file.
+
+    Use as an async context manager: the server subprocess and MCP session are
+    started once on enter and shared by every tool call until exit.
+    """
 
     def __init__(self, repo_root: Path):
         """
@@ -275,160 +447,111 @@ class ParquetMCPClient:
         """
         self.repo_root = repo_root
         self.parquet_server_path, self.parquet_server_command = self._detect_parquet_server()
+        self._exit_stack: AsyncExitStack | None = None
+        self._session: Any = None
 
     def _detect_parquet_server(self) -> tuple[str, str]:
         """
         Auto-detect parquet MCP server location.
-        
+
+        Detection is cached per process, keyed by repo root, the
+        PARQUET_MCP_SERVER_PATH and PARQUET_MCP_PYTHON overrides and the mtime
+        of ~/.cursor/mcp.json.
+
         Returns:
             Tuple of (server_path, command) where:
             - server_path: Path to the server script
             - command: Command to run (python3, bash, or from config)
         """
-        # Try environment variable first
-        env_path = os.getenv("PARQUET_MCP_SERVER_PATH")
-        if env_path and Path(env_path).exists():
-            # Determine command based on file extension
-            if env_path.endswith(".sh"):
-                return (env_path, "bash")
-            else:
-                return (env_path, self._get_python_command())
-
-        # Check Cursor config location: ~/.cursor/mcp.json
         cursor_config_path = Path.home() / ".cursor" / "mcp.json"
-        if cursor_config_path.exists():
-            try:
-                import json
-                with open(cursor_config_path, encoding="utf-8") as f:
-                    cursor_config = json.load(f)
-                    mcp_servers = cursor_config.get("mcpServers", {})
-                    # Look for parquet server in Cursor config
-                    for server_name, server_config in mcp_servers.items():
-                        # Check if server name contains "parquet" (case-insensitive)
-                        if "parquet" in server_name.lower():
-                            # Get command path from config
-                            command = server_config.get("command")
-                            if command and Path(command).exists():
-                                # Determine command based on file extension
-                                if command.endswith(".sh"):
-                                    return (command, "bash")
-                                elif command.endswith(".py"):
-                                    return (command, self._get_python_command())
-                                else:
-                                    # Try to extract command from args if present
-                                    args = server_config.get("args", [])
-                                    if args and len(args) > 0:
-                                        # If args[0] is a Python script, use python command
-                                        if args[0].endswith(".py"):
-                                            return (args[0], self._get_python_command())
-                                    # Default to using the command as-is
-                                    return (command, command)
-            except (json.JSONDecodeError, KeyError, Exception) as e:
-                # Silently continue if config parsing fails
-                pass
-
-        # Check repo location: mcp/parquet/parquet_mcp_server.py
-        server_path = self.repo_root / "mcp" / "parquet" / "parquet_mcp_server.py"
-        if server_path.exists():
-            return (str(server_path), self._get_python_command())
-
-        raise RuntimeError(
-            "Could not find parquet MCP server. "
-            f"Checked: environment variable, ~/.cursor/mcp.json, and {server_path}\n"
-            "Set PARQUET_MCP_SERVER_PATH environment variable, configure in ~/.cursor/mcp.json, "
-            "or ensure the server is at mcp/parquet/parquet_mcp_server.py"
+        try:
+            cursor_mtime_ns = cursor_config_path.stat().st_mtime_ns
+        except OSError:
+            cursor_mtime_ns = 0
+        return _detect_parquet_server_cached(
+            str(self.repo_root),
+            os.getenv("PARQUET_MCP_SERVER_PATH"),
+            os.getenv("PARQUET_MCP_PYTHON"),
+            cursor_mtime_ns,
         )
 
-    def _get_python_command(self) -> str:
-        """Get the Python command to use for running the parquet server."""
-        # Try to find venv Python relative to repo root
-        possible_venv_paths = [
-            self.repo_root / "venv" / "bin" / "python3",
-            self.repo_root / "execution" / "venv" / "bin" / "python3",
-            self.repo_root / ".venv" / "bin" / "python3",
-        ]
-
-        for venv_python in possible_venv_paths:
-            if venv_python.exists():
-                return str(venv_python)
-
-        # Fall back to system python3
-        return os.getenv("PARQUET_MCP_PYTHON", "python3")
+    async def __aenter__(self) -> ParquetMCPClient:
+        """Start the parquet MCP server and initialize a session."""
+        try:
+            from mcp import ClientSession, StdioServerParameters
+            from mcp.client.stdio import stdio_client
+        except ImportError as e:
+            # find_spec only saw the package; a broken install fails here
+            raise RuntimeError(
+                "MCP client dependencies not available. Install with: pip install mcp"
+            ) from e
 
-    async def _call_tool(
-        self, tool_name: str, arguments: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Call a tool on the parquet MCP server."""
         # Use the command determined during detection (python3, bash, etc.)
         cmd = self.parquet_server_command
+        env = mcp_server_env(self.repo_root)
 
-        # Load .env file from repo root to get DATA_DIR and other env vars
-        # Priority: 1) .env file, 2) environment variable, 3) default to repo_root/data
-        env = os.environ.copy()
-        env_file = self.repo_root / ".env"
-        if env_file.exists():
-            # Simple env file parsing (don't use dotenv to avoid dependency)
-            with open(env_file, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        if key:
-                            # Override existing env vars with .env file values
-                            # This allows .env to override environment variables
-                            env[key] = value
-
-        # Auto-set DATA_DIR if not already set (defaults to repo_root/data)
-        # This ensures MCP server can find the data directory
-        # If DATA_DIR is set in .env or environment, it will be used (matches Cursor MCP config)
-        if "DATA_DIR" not in env:
-            data_dir = self.repo_root / "data"
-            env["DATA_DIR"] = str(data_dir.resolve())
+        # Prepare args: if command is bash/python3, pass server_path as arg
+        # If command is the script itself, use empty args
+        if cmd in ["bash", "python3", "python"] or cmd.endswith("python3") or cmd.endswith("python"):
+            args = [self.parquet_server_path]
+        else:
+            # Command is the script itself, no args needed
+            args = []
 
+        exit_stack = AsyncExitStack()
         try:
-            # Prepare args: if command is bash/python3, pass server_path as arg
-            # If command is the script itself, use empty args
-            if cmd in ["bash", "python3", "python"] or cmd.endswith("python3") or cmd.endswith("python"):
-                args = [self.parquet_server_path]
-            else:
-                # Command is the script itself, no args needed
-                args = []
-            
-            async with stdio_client(
-                StdioServerParameters(
-                    command=cmd, args=args, env=env
-                )
-            ) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    result = await session.call_tool(tool_name, arguments)
-                    # Parse the text content from the result
-                    if result.content and len(result.content) > 0:
-                        return json.loads(result.content[0].text)
-                    return {}
+            read, write = await exit_stack.enter_async_context(
+                stdio_client(StdioServerParameters(command=cmd, args=args, env=env))
+            )
+            session = await exit_stack.enter_async_context(ClientSession(read, write))
+            await session.initialize()
         except Exception as e:
+            await exit_stack.aclose()
             # Re-raise with more context
             raise RuntimeError(
-                f"Failed to call parquet MCP tool '{tool_name}': {e}. "
-                f"Python: {python_cmd}, Server: {self.parquet_server_path}"
+                f"Failed to start parquet MCP server: {e}. "
+                f"Command: {cmd}, Server: {self.parquet_server_path}"
             ) from e
 
-    def call_tool_sync(
+        self._exit_stack = exit_stack
+        self._session = session
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the MCP session and stop the server subprocess."""
+        exit_stack, self._exit_stack, self._session = self._exit_stack, None, None
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
+    async def call_tool(
         self, tool_name: str, arguments: dict[str, Any]
     ) -> dict[str, Any]:
-        """Synchronous wrapper for calling MCP tools."""
-        return asyncio.run(self._call_tool(tool_name, arguments))
+        """Call a tool on the parquet MCP server using the open session."""
+        if self._session is None:
+            raise RuntimeError("ParquetMCPClient must be used with 'async with'")
+
+        try:
+            result = await self._session.call_tool(tool_name, arguments)
+        except Exception as e:
+            # Re-raise with more context
+            raise RuntimeError(
+                f"Failed to call parquet MCP tool '{tool_name}': {e}. "
+                f"Server: {self.parquet_server_path}"
+            ) from e
+
+        # Parse the text content from the result
+        if result.content and len(result.content) > 0:
+            return json.loads(result.content[0].text)
+        return {}
 
-    def read_env_var_mappings(self) -> list[dict]:
+    async def read_env_var_mappings(self) -> list[dict]:
         """
         Read env_var_mappings from parquet via MCP.
 
         Returns:
             List of mapping records
         """
-        result = self.call_tool_sync(
+        result = await self.call_tool(
             "read_parquet",
             {
                 "data_type": "env_var_mappings",
@@ -461,8 +584,13 @@ def load_mappings_via_mcp(repo_root: Path) -> tuple[dict[str, str], set[str]]:
             "MCP client dependencies not available. Install with: pip install mcp"
         )
 
-    client = ParquetMCPClient(repo_root)
-    records = client.read_env_var_mappings()
+    import asyncio
+
+    async def read_records() -> list[dict]:
+        async with ParquetMCPClient(repo_root) as client:
+            return await client.read_env_var_mappings()
+
+    records = asyncio.run(read_records())
 
     env_to_op_ref: dict[str, str] = {}
     environment_based_keys: set[str] = set()
@@ -475,8 +603,8 @@ def load_mappings_via_mcp(repo_root: Path) -> tuple[dict[str, str], set[str]]:
         if not env_var or not op_ref:
             continue
 
-        # Skip placeholder values
-        if pd.isna(op_ref) or str(op_ref).startswith("PLACEHOLDER_"):
+        # Skip missing (NaN) and placeholder values
+        if op_ref != op_ref or _PLACEHOLDER_RE.match(str(op_ref)):
             continue
 
         # Handle environment-based keys
@@ -513,43 +641,184 @@ def load_mappings_from_parquet(repo_root: Path) -> tuple[dict[str, str], set[str
             "Create it using the MCP parquet server or by running the migration script."
         )
 
-    df = pd.read_parquet(mappings_file)
-    env_to_op_ref: dict[str, str] = {}
-    environment_based_keys: set[str] = set()
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    # Project the mapping columns and drop missing/placeholder references at
+    # read time, so row groups whose statistics rule them out are skipped;
+    # Arrow rows convert straight to dicts without pandas
+    env_var = pc.field("env_var")
+    op_reference = pc.field("op_reference")
+    filters = (
+        env_var.is_valid()
+        & op_reference.is_valid()
+        & ~pc.starts_with(op_reference, pattern="PLACEHOLDER_")
+    )
+    table = pq.read_table(
+        mappings_file,
+        columns=["env_var", "op_reference", "environment_based", "environment_key"],
+        filters=filters,
+    )
 
     # Get current environment for environment-based keys
     current_env = os.getenv("ENVIRONMENT", "development").lower()
 
-    for _, row in df.iterrows():
-        env_var = row["env_var"]
-        op_ref = row["op_reference"]
+    # Environment-based rows only count if they match the current environment;
+    # lowercase + compare the whole column in one vectorized pass
+    is_environment_based = pc.fill_null(
+        table.column("environment_based").cast(pa.bool_()), False
+    )
+    env_key_lower = pc.utf8_lower(table.column("environment_key").cast(pa.string()))
+    env_matches = pc.fill_null(pc.equal(env_key_lower, pa.scalar(current_env)), False)
+    table_mask = pc.or_(pc.invert(is_environment_based), env_matches)
+    table = table.filter(table_mask)
 
-        # Skip placeholder values
-        if pd.isna(op_ref) or str(op_ref).startswith("PLACEHOLDER_"):
-            continue
+    env_to_op_ref: dict[str, str] = {}
+    environment_based_keys: set[str] = set()
 
-        # Handle environment-based keys
-        is_environment_based = row.get("environment_based", False)
-        if is_environment_based:
-            # Only include if this row matches the current environment
-            env_key = str(row.get("environment_key", "")).lower()
-            if env_key != current_env:
-                continue
+    # Iterate the needed columns side by side instead of building a dict per row
+    for env_var, op_ref, is_env_based in zip(
+        table.column("env_var").to_pylist(),
+        table.column("op_reference").to_pylist(),
+        is_environment_based.filter(table_mask).to_pylist(),
+    ):
+        # Remaining environment-based rows match the current environment
+        if is_env_based:
             environment_based_keys.add(env_var)
 
         # For environment-based keys, we might have multiple rows (dev/prod)
         # Only add if not already present, or replace if this is the matching environment
-        if env_var not in env_to_op_ref or is_environment_based:
+        if env_var not in env_to_op_ref or is_env_based:
             env_to_op_ref[env_var] = str(op_ref)
 
     return env_to_op_ref, environment_based_keys
 
 
+def _mapping_cache_path(repo_root: Path) -> Path:
+    """Path of the on-disk mapping cache (stored alongside .env backups, gitignored)."""
+    return repo_root / ".env.backups" / ".mapping_cache.json"
+
+
+def _mappings_file_mtime(repo_root: Path) -> int | None:
+    """
+    Get modification time of the env_var_mappings parquet file the MCP server reads.
+
+    Returns:
+        st_mtime_ns of the parquet file, or None if it cannot be found
+    """
+    data_dir = Path(mcp_server_env(repo_root)["DATA_DIR"])
+    mappings_file = data_dir / "env_var_mappings" / "env_var_mappings.parquet"
+    try:
+        return mappings_file.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_mapping_cache(
+    repo_root: Path, mtime_ns: int, current_env: str
+) -> tuple[dict[str, str], set[str]] | None:
+    """
+    Read cached mappings if they were stored for the same parquet mtime and environment.
+
+    Returns:
+        Tuple of (env_to_op_ref, environment_based_keys), or None on cache miss
+    """
+    try:
+        with open(_mapping_cache_path(repo_root), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("mtime_ns") != mtime_ns or cached.get("environment") != current_env:
+        return None
+
+    # A malformed cache is a miss, not a failed sync
+    try:
+        env_to_op_ref = cached["env_to_op_ref"]
+        environment_based_keys = cached["environment_based_keys"]
+        if not isinstance(env_to_op_ref, dict) or not isinstance(
+            environment_based_keys, list
+        ):
+            return None
+        return dict(env_to_op_ref), set(environment_based_keys)
+    except (KeyError, TypeError):
+        return None
+
+
+def _write_mapping_cache(
+    repo_root: Path,
+    mtime_ns: int,
+    current_env: str,
+    env_to_op_ref: dict[str, str],
+    environment_based_keys: set[str],
+) -> None:
+    """Store mappings on disk keyed by parquet mtime. Mappings contain op:// references only, never secrets."""
+    cache_path = _mapping_cache_path(repo_root)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write a sibling temp file and rename it over the cache, so an
+        # interrupted write never leaves a truncated cache behind
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "mtime_ns": mtime_ns,
+                    "environment": current_env,
+                    "env_to_op_ref": env_to_op_ref,
+                    "environment_based_keys": sorted(environment_based_keys),
+                },
+                f,
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Cache is best-effort; a failed write only means the next run asks MCP again
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=4)
+def _load_env_mappings_cached(
+    repo_root_str: str, current_env: str
+) -> tuple[dict[str, str], set[str]]:
+    """Load mappings once per (repo_root, environment) per process. See load_env_mappings."""
+    repo_root = Path(repo_root_str)
+
+    # Skip the MCP round-trip entirely if the parquet file is unchanged since last run
+    mtime_ns = _mappings_file_mtime(repo_root)
+    if mtime_ns is not None:
+        cached = _read_mapping_cache(repo_root, mtime_ns, current_env)
+        if cached is not None:
+            print("Loaded mappings from cache (parquet file unchanged)")
+            return cached
+
+    if not MCP_AVAILABLE:
+        raise RuntimeError(
+            "MCP client dependencies not available. Install with: pip install mcp"
+        )
+
+    print("Loading mappings via parquet MCP server...")
+    env_to_op_ref, environment_based_keys = load_mappings_via_mcp(repo_root)
+
+    if mtime_ns is not None:
+        _write_mapping_cache(
+            repo_root, mtime_ns, current_env, env_to_op_ref, environment_based_keys
+        )
+
+    return env_to_op_ref, environment_based_keys
+
+
 def load_env_mappings(repo_root: Path) -> tuple[dict[str, str], set[str]]:
     """
     Load environment variable to 1Password op:// reference mappings via MCP parquet server.
 
     Always uses MCP server - no direct file access (per MCP access policy).
+    Results are memoized per process and cached in .env.backups/.mapping_cache.json,
+    keyed by the parquet file's mtime, so unchanged mappings skip the MCP call.
 
     Args:
         repo_root: Path to repository root
@@ -560,19 +829,23 @@ def load_env_mappings(repo_root: Path) -> tuple[dict[str, str], set[str]]:
     Raises:
         RuntimeError: If MCP is unavailable or fails
     """
-    if not MCP_AVAILABLE:
-        raise RuntimeError(
-            "MCP client dependencies not available. Install with: pip install mcp"
-        )
-
-    print("Loading mappings via parquet MCP server...")
-    return load_mappings_via_mcp(repo_root)
+    current_env = os.getenv("ENVIRONMENT", "development").lower()
+    env_to_op_ref, environment_based_keys = _load_env_mappings_cached(
+        str(repo_root.resolve()), current_env
+    )
+    # Return copies so callers can't mutate the memoized result
+    return dict(env_to_op_ref), set(environment_based_keys)
 
 
+@functools.lru_cache(maxsize=1)
 def check_op_session() -> bool:
     """
     Check if 1Password CLI session is active.
 
+    The result is memoized for the rest of the run, so repeated checks don't
+    spawn `op` again. Call check_op_session.cache_clear() to force a re-probe
+    (resolve_op_refs does so when the `op inject` batch fails).
+
     Returns:
         True if session is active, False otherwise.
 
@@ -614,8 +887,8 @@ def backup_env_file(env_path: Path, repo_root: Path) -> Path | None:
     backup_filename = f".env-{timestamp}"
     backup_path = backup_dir / backup_filename
 
-    # Copy file contents
-    backup_path.write_text(env_path.read_text(encoding="utf-8"), encoding="utf-8")
+    # Copy file contents and metadata (kernel-side copy, no decode/encode round-trip)
+    shutil.copy2(env_path, backup_path)
 
     print(f"Backup created: {backup_path}")
     return backup_path
@@ -648,6 +921,124 @@ def op_read(ref: str) -> str:
     return value
 
 
+def op_inject(env_to_ref: dict[str, str]) -> dict[str, str]:
+    """
+    Read several secret values from 1Password with a single `op inject` call.
+
+    Each reference is rendered into the template after a random per-call
+    delimiter line, so values may span multiple lines (e.g. JSON credentials)
+    and still be split back apart unambiguously.
+
+    Args:
+        env_to_ref: Dictionary mapping env var names to op:// references
+
+    Returns:
+        Dictionary mapping env var names to non-empty secret values
+
+    Raises:
+        RuntimeError: If the CLI fails or the output doesn't match the template
+
+    Security: Never prints or includes CLI output in error messages.
+    """
+    delimiter = f"<<<OP_SYNC_{secrets.token_hex(8)}>>>"
+    template = StringIO()
+    for key, ref in env_to_ref.items():
+        template.write(f"{delimiter}{key}\n{{{{ {ref} }}}}\n")
+
+    # The whole template goes to one `op` process over stdin (no temp file);
+    # run() feeds stdin and drains stdout concurrently, so large templates
+    # can't deadlock on a full pipe
+    try:
+        result = subprocess.run(
+            ["op", "inject"],
+            input=template.getvalue(),
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:  # noqa: BLE001
+        # SECURITY: Never include e.stderr or e.stdout in error message
+        raise RuntimeError(
+            f"1Password CLI error while injecting {len(env_to_ref)} reference(s). "
+            f"Ensure 'op' is installed and you're signed in (run: op signin)"
+        ) from e
+
+    # Output is "", then one "KEY\n<value>\n" chunk per delimiter
+    chunks = result.stdout.split(delimiter)
+    if len(chunks) != len(env_to_ref) + 1 or chunks[0]:
+        raise RuntimeError("Unexpected 'op inject' output")
+
+    values: dict[str, str] = {}
+    for key, chunk in zip(env_to_ref, chunks[1:]):
+        chunk_key, _, value = chunk.partition("\n")
+        if chunk_key != key:
+            raise RuntimeError("Unexpected 'op inject' output")
+        # Same trailing-newline handling as op_read
+        value = value.rstrip("\n")
+        if value:
+            values[key] = value
+    return values
+
+
+def resolve_op_refs(
+    env_to_ref: dict[str, str],
+) -> tuple[dict[str, str], dict[str, RuntimeError]]:
+    """
+    Resolve op:// references with a single `op inject` call.
+
+    If the batch fails (e.g. one bad reference), keys fall back to individual
+    `op read` calls so failures are still reported per key, with the same
+    error messages as before. Individual reads run concurrently.
+
+    Args:
+        env_to_ref: Dictionary mapping env var names to op:// references
+
+    Returns:
+        Tuple of (env var -> secret value, env var -> resolution error)
+    """
+    values: dict[str, str] = {}
+    if env_to_ref:
+        try:
+            values.update(op_inject(env_to_ref))
+        except RuntimeError:
+            pass
+
+    remaining = {k: ref for k, ref in env_to_ref.items() if k not in values}
+    if not remaining:
+        return values, {}
+
+    # Fail fast instead of spawning a pool of doomed `op read` calls. The
+    # memoized check from startup may be stale (e.g. the session expired), so
+    # probe again; this only costs one `op whoami` on the failure path.
+    check_op_session.cache_clear()
+    if not check_op_session():
+        error = RuntimeError(
+            "1Password CLI session is not active (run: op signin)"
+        )
+        return values, {k: error for k in remaining}
+
+    try:
+        max_workers = max(1, int(os.getenv("OP_SYNC_PARALLELISM", OP_READ_MAX_WORKERS)))
+    except ValueError:
+        max_workers = OP_READ_MAX_WORKERS
+
+    # `op read` is subprocess + network bound, so threads overlap the waits.
+    # Completion order doesn't matter: callers report results in mapping order.
+    errors: dict[str, RuntimeError] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(remaining))) as executor:
+        futures = {
+            executor.submit(op_read, op_ref): env_key
+            for env_key, op_ref in remaining.items()
+        }
+        for future in as_completed(futures):
+            env_key = futures[future]
+            try:
+                values[env_key] = future.result()
+            except RuntimeError as e:
+                errors[env_key] = e
+    return values, errors
+
+
 def write_json_to_creds_file(json_content: str, filename: str, repo_root: Path) -> Path:
     """
     Write JSON content to a gitignored .creds directory in the repo and return the path.
@@ -658,23 +1049,20 @@ def write_json_to_creds_file(json_content: str, filename: str, repo_root: Path)
         repo_root: Path to repository root
     
     Returns:
-        Path to the created file
+        Path to the created file, relative to repo_root (as written to .env)
     """
     # Use repo-relative .creds directory (gitignored)
-    creds_dir = repo_root / ".creds"
-    creds_dir.mkdir(parents=True, exist_ok=True)
-    file_path = creds_dir / filename
+    relative_path = Path(CREDS_DIRNAME, filename)
+    file_path = repo_root / relative_path
+    file_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Validate JSON before writing
+    # Validate JSON and write it normalized (2-space indent)
     try:
-        json.loads(json_content)
-    except json.JSONDecodeError:
+        file_path.write_bytes(_json_dumps(_json_loads(json_content)))
+    except ValueError:
         # If not valid JSON, try to use as-is (might be a file path)
-        pass
-    
-    # Write to file
-    file_path.write_text(json_content, encoding="utf-8")
-    return file_path
+        file_path.write_text(json_content, encoding="utf-8")
+    return relative_path
 
 
 def needs_file_write(env_key: str, value: str) -> bool:
@@ -684,68 +1072,208 @@ def needs_file_write(env_key: str, value: str) -> bool:
     Variables that end with _CREDENTIALS and contain JSON should be written to files.
     GOOGLE_APPLICATION_CREDENTIALS always needs a file path (even if value is already a path).
     """
-    # GOOGLE_APPLICATION_CREDENTIALS always expects a file path
-    if env_key == "GOOGLE_APPLICATION_CREDENTIALS":
-        # If it's already a file path (not JSON), use it as-is
-        if not value.strip().startswith("{") and (value.endswith(".json") or "/" in value or "\\" in value):
-            return False  # Already a file path, don't write
-        # If it's JSON content, write it to a file
-        try:
-            json.loads(value)
-            return True  # It's JSON, write to file
-        except (json.JSONDecodeError, TypeError):
-            return False  # Not JSON, assume it's already a path
-    
-    # Other _CREDENTIALS variables: write if they contain JSON
-    if env_key.endswith("_CREDENTIALS"):
-        try:
-            json.loads(value)
-            return True
-        except (json.JSONDecodeError, TypeError):
-            return False
-    
-    return False
+    # Only _CREDENTIALS variables (including GOOGLE_APPLICATION_CREDENTIALS,
+    # which always expects a file path) are candidates
+    if not env_key.endswith("_CREDENTIALS"):
+        return False
+
+    # Cheap prefix check before a full parse: only JSON objects/arrays are
+    # written to files. Anything else (e.g. an existing file path) is used as-is.
+    if not value.lstrip().startswith(("{", "[")):
+        return False
+
+    try:
+        _json_loads(value)
+        return True  # It's JSON, write to file
+    except (ValueError, TypeError):
+        return False
 
 
 def parse_env_file(path: Path) -> tuple[list[str], dict[str, str]]:
     """
     Parse .env file into comments/headers and variable dictionary.
 
+    Parsed results are memoized by (path, mtime, size), so the repo .env is
+    read once per run even though both the MCP server environment and
+    sync_env need it. A rewritten file is parsed again.
+
     Returns:
         Tuple of (comment_lines, variables_dict)
     """
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return [], {}
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    comment_lines, variables = _parse_env_file_cached(
+        str(path.resolve()), stat.st_mtime_ns, stat.st_size
+    )
+    # Return copies so callers can't mutate the memoized result
+    return list(comment_lines), dict(variables)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_env_file_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> tuple[tuple[str, ...], dict[str, str]]:
+    """Read and parse a .env file. mtime_ns and size only key the cache."""
+    text = Path(path_str).read_text(encoding="utf-8")
     comment_lines: list[str] = []
     variables: dict[str, str] = {}
 
-    for line in lines:
-        stripped = line.strip()
-        # Preserve comments and empty lines
-        if not stripped or stripped.startswith("#"):
-            comment_lines.append(line)
-            continue
+    # Single regex pass over the whole file instead of per-line strip/split
+    for match in _ENV_LINE_RE.finditer(text):
+        key = match.group("key")
+        if key is not None:
+            # Parse variable assignments
+            variables[key] = match.group("value").strip()
+        elif match.end() < len(text) or match.group("other"):
+            # Preserve comments, empty lines and non-assignment lines as-is
+            # (skipping the empty match after the final newline)
+            comment_lines.append(match.group("other"))
 
-        # Parse variable assignments
-        if "=" in line:
-            key, value = line.split("=", 1)
-            key = key.strip()
-            if key:
-                variables[key] = value.strip()
-        else:
-            # Non-comment line without =, preserve as-is
-            comment_lines.append(line)
+    return tuple(comment_lines), variables
 
-    return comment_lines, variables
+
+def quote_env_value(value: str) -> str:
+    """
+    Format a value for the right-hand side of a .env assignment.
+
+    Values made only of safe characters (letters, digits, _ . / : @ = + -) are
+    written bare. Values containing $ (and no ' or line breaks) are single-quoted
+    so dotenv and docker compose don't expand $VAR inside them. Anything else is
+    double-quoted with backslashes, quotes and line breaks escaped, so a secret
+    containing " or spaces can't break the line.
+    """
+    if _ENV_SAFE.match(value):
+        return value
+    if "$" in value and not _ENV_NO_SINGLE_QUOTE.search(value):
+        return f"'{value}'"
+    escaped = (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+    return f'"{escaped}"'
+
+
+def unquote_env_value(value: str) -> str:
+    """
+    Reverse quote_env_value for a raw .env value.
+
+    Matching outer quotes are stripped; escape sequences are only decoded in
+    double-quoted values. Unquoted values are returned as-is.
+    """
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1]
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return _ENV_ESCAPE_RE.sub(lambda m: _ENV_UNESCAPES[m.group(1)], value[1:-1])
+    return value
+
+
+def write_env_file(path: Path, lines: Iterable[str]) -> None:
+    """
+    Atomically replace a .env file with the given lines.
+
+    Writes and fsyncs a sibling temp file, then renames it over the target, so
+    a crash or Ctrl-C leaves either the old or the new file, never a partial
+    one. The temp file is created 600 and removed if anything fails; the
+    existing file mode (e.g. 600) is kept and symlinks are written through.
+
+    Args:
+        path: Path to .env file
+        lines: File lines without trailing newlines
+    """
+    target = path.resolve()
+    tmp_path = target.with_name(target.name + ".tmp")
+    # A leftover from a killed run would make O_EXCL fail forever
+    try:
+        os.unlink(tmp_path)
+    except FileNotFoundError:
+        pass
+    # Owner-only from the start: the temp file holds every secret while it's written
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with open(fd, "w", encoding="utf-8", newline="\n") as f:
+            f.writelines(line + "\n" for line in lines)
+            f.flush()
+            os.fsync(f.fileno())
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        # Don't leave secrets behind on errors or Ctrl-C
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _resolved_cache_path(repo_root: Path) -> Path:
+    """Path of the resolved-value cache (stored alongside .env backups, gitignored)."""
+    return repo_root / ".env.backups" / ".op_resolved.json"
+
+
+def _resolved_cache_key(env_key: str, op_ref: str) -> str:
+    """Cache key for an (env var, op:// reference) pair."""
+    return f"{env_key}={op_ref}"
+
+
+def _value_hash(env_key: str, op_ref: str, value: str) -> str:
+    """
+    Truncated SHA-256 of a .env value. Only hashes are cached, never values.
+
+    The variable name and reference are hashed in with the value, so one
+    precomputed table can't be used to guess every cached secret.
+    """
+    digest = hashlib.sha256(f"{env_key}\0{op_ref}\0{value}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _read_resolved_cache_file(repo_root: Path) -> dict[str, dict[str, str]]:
+    """Read every target's resolved-value entries, or an empty dict if missing or unreadable."""
+    try:
+        with open(_resolved_cache_path(repo_root), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cached, dict):
+        return {}
+    # Ignore anything that isn't a per-target mapping (e.g. an older flat cache)
+    return {k: v for k, v in cached.items() if isinstance(v, dict)}
+
+
+def _read_resolved_cache(repo_root: Path, target_path: Path) -> dict[str, str]:
+    """Read the resolved-value cache for one .env file (empty dict if none)."""
+    return _read_resolved_cache_file(repo_root).get(str(target_path.resolve()), {})
+
+
+def _write_resolved_cache(
+    repo_root: Path, target_path: Path, cache: dict[str, str]
+) -> None:
+    """Replace one .env file's entries in the resolved-value cache (best-effort)."""
+    cache_path = _resolved_cache_path(repo_root)
+    entries = _read_resolved_cache_file(repo_root)
+    entries[str(target_path.resolve())] = cache
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # O_CREAT's mode doesn't apply to an existing file
+        os.fchmod(fd, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+    except OSError:
+        pass
 
 
 def sync_env(
     target_path: Path,
     repo_root: Path,
     exclusions: set[str],
-    inclusions: set[str] | None = None,
+    inclusions: AbstractSet[str] | None = None,
+    force: bool = False,
 ) -> None:
     """
     Resolve all environment variable mappings via op, then REPLACE the .env file.
@@ -753,12 +1281,18 @@ def sync_env(
     Preserves unmanaged variables (variables not in 1Password mappings).
     Replaces managed variables with values from 1Password.
 
+    Variables whose reference is unchanged since the last sync and whose current
+    .env value still matches the hash recorded in .env.backups/.op_resolved.json
+    are kept without asking 1Password again. A secret rotated in 1Password under
+    the same reference is only picked up with force=True (--force).
+
     Args:
         target_path: Path to .env file
         repo_root: Path to repository root
         exclusions: Set of variable names to exclude from preservation
         inclusions: Optional set of variable names to include (whitelist).
                    If None, all variables with mappings are synced.
+        force: Refetch every variable, ignoring the resolved-value cache
 
     Security: Only prints environment variable names, never values.
     Skips variables with PLACEHOLDER references that need to be configured.
@@ -778,9 +1312,11 @@ def sync_env(
 
     # Apply inclusion list (whitelist) if specified
     if inclusions is not None:
-        original_count = len(env_to_op_ref)
-        env_to_op_ref = {k: v for k, v in env_to_op_ref.items() if k in inclusions}
-        filtered_count = original_count - len(env_to_op_ref)
+        # Filter once, before any classification or output; keep the unfiltered
+        # mappings for the "available variables" hint below
+        all_mappings = env_to_op_ref
+        env_to_op_ref = {k: v for k, v in all_mappings.items() if k in inclusions}
+        filtered_count = len(all_mappings) - len(env_to_op_ref)
         if filtered_count > 0:
             print(f"\nInclusion list active: {filtered_count} variable(s) filtered out")
             print(f"Syncing {len(env_to_op_ref)} variable(s) from inclusion list")
@@ -789,150 +1325,188 @@ def sync_env(
                 "\nWARNING: No environment variable mappings match the inclusion list."
             )
             print("Available variables in parquet (not in inclusion list):")
-            all_mappings = load_env_mappings(repo_root)
-            for var in sorted(all_mappings.keys()):
-                if var not in inclusions:
-                    print(f"  - {var}")
+            for var in sorted(all_mappings.keys() - inclusions):
+                print(f"  - {var}")
             return
 
-    # Parse existing .env file
-    comment_lines, existing_vars = parse_env_file(target_path)
-
-    # Identify unmanaged variables (variables not in 1Password mappings)
-    managed_var_names = set(env_to_op_ref.keys())
-    unmanaged_vars = {
-        k: v
-        for k, v in existing_vars.items()
-        if k not in managed_var_names and k not in exclusions
-    }
-
-    if unmanaged_vars:
-        print(f"\nPreserving {len(unmanaged_vars)} unmanaged variable(s):")
-        for var in sorted(unmanaged_vars.keys()):
-            print(f"  - {var}")
-
-    if exclusions:
-        excluded_count = sum(1 for k in existing_vars if k in exclusions)
-        if excluded_count > 0:
-            print(f"\nExcluding {excluded_count} variable(s) from preservation:")
-            for var in sorted(k for k in existing_vars if k in exclusions):
-                print(f"  - {var}")
+    # Buffer per-key status lines and write them once at the end (flushed even
+    # if the sync fails part-way, so progress isn't lost)
+    log: list[str] = []
+    try:
+        # Parse existing .env file
+        comment_lines, existing_vars = parse_env_file(target_path)
+
+        # Identify unmanaged variables (variables not in 1Password mappings)
+        existing_keys = existing_vars.keys()
+        excluded_keys = existing_keys & exclusions
+        unmanaged_keys = existing_keys - env_to_op_ref.keys() - exclusions
+        # Sorted once; reused for the summary and the emitted file
+        unmanaged_keys_sorted = sorted(unmanaged_keys)
+        unmanaged_vars = {k: existing_vars[k] for k in unmanaged_keys_sorted}
+
+        if unmanaged_vars:
+            log.append(f"\nPreserving {len(unmanaged_vars)} unmanaged variable(s):")
+            for var in unmanaged_keys_sorted:
+                log.append(f"  - {var}")
+
+        if excluded_keys:
+            log.append(f"\nExcluding {len(excluded_keys)} variable(s) from preservation:")
+            for var in sorted(excluded_keys):
+                log.append(f"  - {var}")
+
+        # Resolve managed variables from 1Password
+        updated: set[str] = set()
+        skipped = []
+        unchanged = []
+        resolved_vars: dict[str, str] = {}
+        environment = os.getenv("ENVIRONMENT", "development").lower()
+
+        # Skip refetching variables whose .env value still matches the hash recorded
+        # for the same reference on the last sync
+        resolved_cache = {} if force else _read_resolved_cache(repo_root, target_path)
+        new_resolved_cache: dict[str, str] = {}
+        in_sync = {
+            k
+            for k, ref in env_to_op_ref.items()
+            if k in existing_vars
+            and resolved_cache.get(_resolved_cache_key(k, ref))
+            == _value_hash(k, ref, existing_vars[k])
+        }
+
+        # Resolve all remaining non-placeholder references up front (one `op inject`
+        # call instead of one `op read` subprocess per key)
+        to_resolve = {
+            k: v
+            for k, v in env_to_op_ref.items()
+            if not _PLACEHOLDER_RE.match(v) and k not in in_sync
+        }
+        values, errors = resolve_op_refs(to_resolve)
+
+        for env_key, op_ref in env_to_op_ref.items():
+            # Skip placeholder values that need to be configured
+            if _PLACEHOLDER_RE.match(op_ref):
+                skipped.append(env_key)
+                # If placeholder variable exists in current file, preserve it
+                if env_key in existing_vars:
+                    resolved_vars[env_key] = existing_vars[env_key]
+                    log.append(f"- Preserving {env_key} (placeholder, using existing value)...")
+                continue
 
-    # Resolve managed variables from 1Password
-    updated = []
-    skipped = []
-    resolved_vars: dict[str, str] = {}
-    environment = os.getenv("ENVIRONMENT", "development").lower()
-
-    for env_key, op_ref in env_to_op_ref.items():
-        # Skip placeholder values that need to be configured
-        if op_ref.startswith("PLACEHOLDER_"):
-            skipped.append(env_key)
-            # If placeholder variable exists in current file, preserve it
-            if env_key in existing_vars:
+            if env_key in in_sync:
                 resolved_vars[env_key] = existing_vars[env_key]
-                print(f"- Preserving {env_key} (placeholder, using existing value)...")
-            continue
+                new_resolved_cache[_resolved_cache_key(env_key, op_ref)] = _value_hash(
+                    env_key, op_ref, existing_vars[env_key]
+                )
+                unchanged.append(env_key)
+                log.append(f"- {env_key} unchanged since last sync (use --force to refetch)")
+                continue
 
-        # Show environment info for environment-based keys
-        if env_key in environment_based_keys:
-            print(f"- Resolving {env_key} (using {environment} key)...")
-        else:
-            print(f"- Resolving {env_key}...")
+            # Show environment info for environment-based keys
+            if env_key in environment_based_keys:
+                log.append(f"- Resolving {env_key} (using {environment} key)...")
+            else:
+                log.append(f"- Resolving {env_key}...")
+
+            if env_key in errors:
+                log.append(f"  WARNING: Failed to resolve {env_key}: {errors[env_key]}")
+                # If variable exists in current file, preserve it as fallback
+                if env_key in existing_vars:
+                    resolved_vars[env_key] = existing_vars[env_key]
+                    log.append("  Using existing value as fallback")
+                continue
+
+            value = values[env_key]
 
-        try:
-            value = op_read(op_ref)
-            
             # Special handling: Write JSON credentials to .creds file if needed
             if needs_file_write(env_key, value):
-                # Generate filename from env var name
-                if env_key == "GOOGLE_OAUTH_CREDENTIALS":
-                    filename = "gcp-oauth.keys.json"
-                elif env_key == "GOOGLE_APPLICATION_CREDENTIALS":
-                    filename = "gcp-service-account.json"
-                else:
-                    # Generic fallback: convert ENV_VAR_CREDENTIALS to filename
-                    filename = env_key.lower().replace("_", "-") + ".json"
-                
-                # Write JSON to .creds file
-                creds_file_path = write_json_to_creds_file(value, filename, repo_root)
-                # Set env var to relative path from repo root
-                relative_path = creds_file_path.relative_to(repo_root)
-                resolved_vars[env_key] = f'"{relative_path}"'
-                print(f"  → Saved JSON to {relative_path}")
+                # Known credentials use fixed filenames; others are derived
+                # from the env var name (ENV_VAR_CREDENTIALS -> env-var-credentials.json)
+                filename = (
+                    CREDS_FILENAMES.get(env_key)
+                    or f"{env_key.lower().replace('_', '-')}.json"
+                )
+
+                # Write JSON to .creds file; env var gets the repo-relative path
+                relative_path = write_json_to_creds_file(value, filename, repo_root)
+                resolved_vars[env_key] = quote_env_value(relative_path.as_posix())
+                log.append(f"  → Saved JSON to {relative_path}")
             else:
-                # Regular value: wrap in quotes
-                resolved_vars[env_key] = f'"{value}"'
-            
-            updated.append(env_key)
-        except RuntimeError as e:
-            print(f"  WARNING: Failed to resolve {env_key}: {e}")
-            # If variable exists in current file, preserve it as fallback
-            if env_key in existing_vars:
-                resolved_vars[env_key] = existing_vars[env_key]
-                print("  Using existing value as fallback")
-
-    # Build new .env file content
-    new_lines: list[str] = []
-
-    # Add comments/headers from original file (strip leading empty lines and our own section headers)
-    stripped_comments = comment_lines[:]
-    # Remove leading empty lines
-    while stripped_comments and not stripped_comments[0].strip():
-        stripped_comments.pop(0)
-    # Remove our own section headers if they exist (from previous runs)
-    stripped_comments = [
-        line
-        for line in stripped_comments
-        if not line.strip().startswith("# Variables managed by 1Password sync")
-        and not line.strip().startswith("# Variables not managed by 1Password")
-    ]
-    # Remove trailing empty lines from comments
-    while stripped_comments and not stripped_comments[-1].strip():
-        stripped_comments.pop()
-    new_lines.extend(stripped_comments)
-
-    # Add managed variables (from 1Password)
-    if resolved_vars:
-        # Add separator only if we have meaningful comments (don't start file with empty line)
-        if stripped_comments:
-            new_lines.append("")  # Blank line separator
-        new_lines.append("# Variables managed by 1Password sync")
-        for key in sorted(resolved_vars.keys()):
-            new_lines.append(f"{key}={resolved_vars[key]}")
-
-    # Add unmanaged variables (preserved from original file)
-    if unmanaged_vars:
-        new_lines.append("")
-        new_lines.append("# Variables not managed by 1Password (preserved)")
-        for key in sorted(unmanaged_vars.keys()):
-            new_lines.append(f"{key}={unmanaged_vars[key]}")
-
-    # Write new file (replaces entire file)
-    target_path.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
-
-    if updated:
-        print(
-            f"\n✓ Replaced {len(updated)} managed variable(s) in .env (values NOT shown):"
-        )
-        for k in sorted(updated):
-            print(f"  - {k}")
-    else:
-        print("\nNo managed variables were updated.")
-
-    if skipped:
-        print("\nSkipped keys with PLACEHOLDER references (need configuration):")
-        for k in skipped:
-            print(f"  - {k}")
-        print("\nTo configure these variables:")
-        print('  1. Find the 1Password item: op item get "<item-name>" --format=json')
-        print(
-            "  2. Update data/env_var_mappings/env_var_mappings.parquet with actual op:// references"
-        )
-        print(
-            "  3. Use MCP parquet server (add_record/update_record) or edit parquet directly"
-        )
-        print("  4. Remove the PLACEHOLDER_ prefix from op_reference field")
+                # Regular value: quote/escape only when needed
+                resolved_vars[env_key] = quote_env_value(value)
+                # Credential files aren't cached since the file itself may go missing
+                new_resolved_cache[_resolved_cache_key(env_key, op_ref)] = _value_hash(
+                    env_key, op_ref, resolved_vars[env_key]
+                )
+
+            updated.add(env_key)
+
+        # Add comments/headers from original file (drop our own section headers
+        # from previous runs, then trim leading/trailing empty lines)
+        cleaned = [line for line in comment_lines if not _SKIP_COMMENT_RE.match(line)]
+        start, end = 0, len(cleaned)
+        while start < end and not cleaned[start].strip():
+            start += 1
+        while end > start and not cleaned[end - 1].strip():
+            end -= 1
+        stripped_comments = cleaned[start:end]
+
+        # Sort managed keys once for both the file and the summary
+        managed_keys = sorted(resolved_vars)
+
+        def emit_lines() -> Iterator[str]:
+            """Yield the new .env file content line by line."""
+            yield from stripped_comments
+
+            # Add managed variables (from 1Password)
+            if resolved_vars:
+                # Add separator only if we have meaningful comments (don't start file with empty line)
+                if stripped_comments:
+                    yield ""  # Blank line separator
+                yield "# Variables managed by 1Password sync"
+                for key in managed_keys:
+                    yield f"{key}={resolved_vars[key]}"
+
+            # Add unmanaged variables (preserved from original file)
+            if unmanaged_vars:
+                yield ""
+                yield "# Variables not managed by 1Password (preserved)"
+                for key in unmanaged_keys_sorted:
+                    yield f"{key}={unmanaged_vars[key]}"
+
+        # Write new file (replaces entire file), streaming lines into the writer
+        write_env_file(target_path, emit_lines())
+        _write_resolved_cache(repo_root, target_path, new_resolved_cache)
+
+        if updated:
+            log.append(
+                f"\n✓ Replaced {len(updated)} managed variable(s) in .env (values NOT shown):"
+            )
+            log.extend(f"  - {k}" for k in managed_keys if k in updated)
+        else:
+            log.append("\nNo managed variables were updated.")
+
+        if unchanged:
+            log.append(
+                f"\nKept {len(unchanged)} variable(s) unchanged since last sync "
+                "(run with --force to refetch)"
+            )
+
+        if skipped:
+            log.append("\nSkipped keys with PLACEHOLDER references (need configuration):")
+            for k in skipped:
+                log.append(f"  - {k}")
+            log.append("\nTo configure these variables:")
+            log.append('  1. Find the 1Password item: op item get "<item-name>" --format=json')
+            log.append(
+                "  2. Update data/env_var_mappings/env_var_mappings.parquet with actual op:// references"
+            )
+            log.append(
+                "  3. Use MCP parquet server (add_record/update_record) or edit parquet directly"
+            )
+            log.append("  4. Remove the PLACEHOLDER_ prefix from op_reference field")
+    finally:
+        if log:
+            sys.stdout.write("\n".join(log) + "\n")
 
 
 def main() -> int:
@@ -944,6 +1518,11 @@ def main() -> int:
         nargs="?",
         help="Path to .env file (default: .env in repo root)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Refetch every secret from 1Password, ignoring the resolved-value cache",
+    )
     args = parser.parse_args()
 
     # Find repository root
@@ -993,7 +1572,7 @@ def main() -> int:
     # Step 3: Sync environment variables
     print("Syncing environment variables from 1Password...\n")
     try:
-        sync_env(target, repo_root, exclusions, inclusions)
+        sync_env(target, repo_root, exclusions, inclusions, force=args.force)
         print("\n✓ Sync completed successfully!")
         return 0
     except Exception as e: